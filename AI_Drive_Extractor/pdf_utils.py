@@ -3,6 +3,11 @@ from typing import Dict
 
 import pdfplumber
 
+# Field patterns are compiled once at import rather than looked up per call.
+INVOICE_NUMBER_PATTERN = re.compile(r"Invoice\s*(?:Number|#)\s*[:\-]?\s*(\S+)", re.IGNORECASE)
+DATE_PATTERN = re.compile(r"Date\s*[:\-]?\s*([\d/\-]+)", re.IGNORECASE)
+TOTAL_PATTERN = re.compile(r"Total\s*[:\-]?\s*\$?([\d,.]+)", re.IGNORECASE)
+
 
 def extract_fields_from_pdf(file_path: str) -> Dict[str, str]:
     """Simple PDF text extraction with naive field parsing."""
@@ -10,13 +15,13 @@ def extract_fields_from_pdf(file_path: str) -> Dict[str, str]:
         text = "\n".join(page.extract_text() or "" for page in pdf.pages)
 
     fields = {}
-    invoice_match = re.search(r"Invoice\s*(?:Number|#)\s*[:\-]?\s*(\S+)", text, re.IGNORECASE)
+    invoice_match = INVOICE_NUMBER_PATTERN.search(text)
     if invoice_match:
         fields["invoice_number"] = invoice_match.group(1)
-    date_match = re.search(r"Date\s*[:\-]?\s*([\d/\-]+)", text, re.IGNORECASE)
+    date_match = DATE_PATTERN.search(text)
     if date_match:
         fields["date"] = date_match.group(1)
-    total_match = re.search(r"Total\s*[:\-]?\s*\$?([\d,.]+)", text, re.IGNORECASE)
+    total_match = TOTAL_PATTERN.search(text)
     if total_match:
         fields["total"] = total_match.group(1)
 
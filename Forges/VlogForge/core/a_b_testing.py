@@ -15,10 +15,14 @@ The module is developed using a Test-Driven Development (TDD) approach.
 """
 
 import os
-import json
 import logging
 import statistics
+import tempfile
 from scipy import stats
+try:
+    from .json_io import dumps_json_bytes, read_json_bytes
+except ImportError:  # run directly as a script
+    from json_io import dumps_json_bytes, read_json_bytes
 import unittest
 
 # Configure logging for this module.
@@ -157,13 +161,16 @@ class ABTestExperiment:
         :param file_path: Path to the file where data will be saved.
         """
         try:
+            # Serialize before touching the existing file, so a value that
+            # cannot be encoded leaves it in place rather than only a backup.
+            raw = dumps_json_bytes(self.to_dict())
             if os.path.exists(file_path):
                 # Backup existing file
                 backup_path = file_path + ".bak"
                 os.replace(file_path, backup_path)
                 logging.info(f"Existing file backed up to {backup_path}.")
-            with open(file_path, "w") as f:
-                json.dump(self.to_dict(), f, indent=4)
+            with open(file_path, "wb") as f:
+                f.write(raw)
             logging.info("Experiment data saved successfully.")
         except Exception as e:
             logging.error(f"Error saving experiment data: {e}")
@@ -179,8 +186,7 @@ class ABTestExperiment:
         :return: An instance of ABTestExperiment.
         """
         try:
-            with open(file_path, "r") as f:
-                data = json.load(f)
+            data = read_json_bytes(file_path)
             if "name" not in data or "variants" not in data:
                 raise ValueError("Invalid experiment data structure.")
             experiment = cls(data["name"])
@@ -206,9 +212,14 @@ class ABTestExperiment:
 
 class TestABTestExperiment(unittest.TestCase):
     def setUp(self):
-        self.experiment = ABTestExperiment("Content Optimization Test")
-        self.experiment.add_variant("Variant A", {"title": "Title A", "caption": "Caption A", "post_time": "10:00 AM"})
-        self.experiment.add_variant("Variant B", {"title": "Title B", "caption": "Caption B", "post_time": "2:00 PM"})
+        self.experiment = self._new_experiment()
+
+    @staticmethod
+    def _new_experiment():
+        experiment = ABTestExperiment("Content Optimization Test")
+        experiment.add_variant("Variant A", {"title": "Title A", "caption": "Caption A", "post_time": "10:00 AM"})
+        experiment.add_variant("Variant B", {"title": "Title B", "caption": "Caption B", "post_time": "2:00 PM"})
+        return experiment
 
     def test_add_variant(self):
         with self.assertRaises(ValueError):
@@ -225,23 +236,21 @@ class TestABTestExperiment(unittest.TestCase):
         self.assertEqual(data["Variant A"], [150])
         self.assertEqual(data["Variant B"], [120])
 
-    def test_determine_winner_no_significant_difference(self):
-        # Similar data in both variants should yield no statistically significant winner.
-        self.experiment.record_engagement("Variant A", "likes", 100)
-        self.experiment.record_engagement("Variant A", "likes", 102)
-        self.experiment.record_engagement("Variant B", "likes", 101)
-        self.experiment.record_engagement("Variant B", "likes", 103)
-        winner = self.experiment.determine_winner("likes")
-        self.assertIsNone(winner)
-
-    def test_determine_winner_with_significant_difference(self):
-        # A clear performance gap should yield a winner.
-        self.experiment.record_engagement("Variant A", "likes", 200)
-        self.experiment.record_engagement("Variant A", "likes", 210)
-        self.experiment.record_engagement("Variant B", "likes", 100)
-        self.experiment.record_engagement("Variant B", "likes", 105)
-        winner = self.experiment.determine_winner("likes")
-        self.assertEqual(winner, "Variant A")
+    def test_determine_winner(self):
+        # Similar data in both variants should yield no statistically
+        # significant winner; a clear performance gap should yield one.
+        cases = [
+            ("no significant difference", [100, 102], [101, 103], None),
+            ("significant difference", [200, 210], [100, 105], "Variant A"),
+        ]
+        for label, likes_a, likes_b, expected in cases:
+            with self.subTest(label):
+                experiment = self._new_experiment()
+                for value in likes_a:
+                    experiment.record_engagement("Variant A", "likes", value)
+                for value in likes_b:
+                    experiment.record_engagement("Variant B", "likes", value)
+                self.assertEqual(experiment.determine_winner("likes"), expected)
 
     def test_generate_performance_report(self):
         # Before recording any engagement, report should show zero count and None for mean.
@@ -260,22 +269,31 @@ class TestABTestExperiment(unittest.TestCase):
         self.assertAlmostEqual(report["Variant B"]["mean"], 165)
 
     def test_save_and_load(self):
-        # Test saving to a file and then loading from it.
-        file_path = "experiment_test.json"
-        # Ensure any existing test file is removed.
-        if os.path.exists(file_path):
-            os.remove(file_path)
-        self.experiment.record_engagement("Variant A", "likes", 150)
-        self.experiment.save_to_file(file_path)
-        loaded_experiment = ABTestExperiment.load_from_file(file_path)
+        # Test saving to a file and then loading from it. The file (and any
+        # .bak/.corrupt siblings) lives in a throwaway directory, so there is
+        # nothing to remove before or after the test.
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "experiment_test.json")
+            self.experiment.record_engagement("Variant A", "likes", 150)
+            self.experiment.save_to_file(file_path)
+            loaded_experiment = ABTestExperiment.load_from_file(file_path)
         self.assertEqual(loaded_experiment.name, self.experiment.name)
         data = loaded_experiment.get_metric_data("likes")
         self.assertEqual(data["Variant A"], [150])
-        # Cleanup test file(s)
-        for f in [file_path, file_path + ".bak", file_path + ".corrupt"]:
-            if os.path.exists(f):
-                os.remove(f)
 
+    def test_save_numpy_values_over_existing_file(self):
+        # Metric values computed with numpy must save like plain floats, and
+        # overwriting keeps both the new file and the backup of the old one.
+        import numpy as np  # test-only; the store itself does not need numpy
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "experiment_test.json")
+            self.experiment.save_to_file(file_path)
+            self.experiment.record_engagement("Variant A", "likes", np.float64(3.5))
+            self.experiment.save_to_file(file_path)
+            self.assertTrue(os.path.exists(file_path + ".bak"))
+            loaded_experiment = ABTestExperiment.load_from_file(file_path)
+        self.assertEqual(loaded_experiment.get_metric_data("likes")["Variant A"], [3.5])
 
 if __name__ == '__main__':
     # Run unit tests with increased verbosity.
@@ -59,8 +59,10 @@ class AICaptionSuggester:
         return list(set(hashtags))  # Remove duplicates
 
 class TestAICaptionSuggester(unittest.TestCase):
-    def setUp(self):
-        self.suggester = AICaptionSuggester()
+    @classmethod
+    def setUpClass(cls):
+        # The suggester holds no state, so one instance serves every test
+        cls.suggester = AICaptionSuggester()
 
     def test_suggest_captions_with_valid_content(self):
         content = "AI in marketing"
@@ -1,6 +1,5 @@
 import unittest
 from datetime import datetime, timedelta
-from unittest.mock import patch
 
 class AutoPostScheduler:
     def __init__(self):
@@ -47,9 +46,6 @@ class AutoPostScheduler:
         if current_time is None:
             current_time = datetime.now()
 
-        # Debug prints to show internal state before and after publishing
-        print("Scheduled posts before publishing:", self.scheduled_posts)
-
         published_posts = []
         remaining_posts = []
         for post in self.scheduled_posts:
@@ -61,9 +57,6 @@ class AutoPostScheduler:
         self.published_posts.extend(published_posts)
         self.scheduled_posts = remaining_posts
 
-        print("Published posts:", self.published_posts)
-        print("Scheduled posts after publishing:", self.scheduled_posts)
-
         return published_posts
 
     def update_post_content(self, old_content, new_content):
@@ -81,12 +74,18 @@ class AutoPostScheduler:
         return result
 
 class TestAutoPostScheduler(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # One clock read shared by every test; the offsets used below are
+        # hours, far beyond how long the suite takes to run.
+        cls.now = datetime.now()
+
     def setUp(self):
         self.scheduler = AutoPostScheduler()
 
     def test_schedule_post(self):
         post_content = "This is a scheduled post."
-        scheduled_time = datetime.now() + timedelta(hours=1)
+        scheduled_time = self.now + timedelta(hours=1)
         result = self.scheduler.schedule_post(post_content, scheduled_time)
         self.assertTrue(result["success"])
         self.assertEqual(result["message"], "Post scheduled successfully.")
@@ -94,14 +93,14 @@ class TestAutoPostScheduler(unittest.TestCase):
 
     def test_cannot_schedule_post_in_past(self):
         post_content = "This is a past post."
-        scheduled_time = datetime.now() - timedelta(hours=1)
+        scheduled_time = self.now - timedelta(hours=1)
         result = self.scheduler.schedule_post(post_content, scheduled_time)
         self.assertFalse(result["success"])
         self.assertEqual(result["message"], "Cannot schedule a post in the past.")
 
     def test_prevent_duplicate_scheduled_posts(self):
         post_content = "This is a duplicate post."
-        scheduled_time = datetime.now() + timedelta(hours=2)
+        scheduled_time = self.now + timedelta(hours=2)
         # Schedule the first post
         self.scheduler.schedule_post(post_content, scheduled_time)
         # Attempt to schedule the same post again for the same time
@@ -111,8 +110,8 @@ class TestAutoPostScheduler(unittest.TestCase):
 
     def test_reschedule_post(self):
         post_content = "This is a post to reschedule."
-        original_time = datetime.now() + timedelta(hours=1)
-        new_time = datetime.now() + timedelta(hours=3)
+        original_time = self.now + timedelta(hours=1)
+        new_time = self.now + timedelta(hours=3)
         self.scheduler.schedule_post(post_content, original_time)
         result = self.scheduler.reschedule_post(post_content, new_time)
         self.assertTrue(result["success"])
@@ -121,7 +120,7 @@ class TestAutoPostScheduler(unittest.TestCase):
 
     def test_delete_post(self):
         post_content = "This is a post to delete."
-        scheduled_time = datetime.now() + timedelta(hours=1)
+        scheduled_time = self.now + timedelta(hours=1)
         self.scheduler.schedule_post(post_content, scheduled_time)
         result = self.scheduler.delete_post(post_content)
         self.assertTrue(result["success"])
@@ -146,7 +145,7 @@ class TestAutoPostScheduler(unittest.TestCase):
     def test_update_post_content(self):
         post_content = "Original content."
         updated_content = "Updated content."
-        scheduled_time = datetime.now() + timedelta(hours=1)
+        scheduled_time = self.now + timedelta(hours=1)
         self.scheduler.schedule_post(post_content, scheduled_time)
         result = self.scheduler.update_post_content(post_content, updated_content)
         self.assertTrue(result["success"])
@@ -1,10 +1,13 @@
+import os
+import tempfile
 import unittest
 from datetime import datetime
 from textblob import TextBlob
 import random
 
 class BatchContentGenerator:
-    def __init__(self):
+    def __init__(self, drafts_path='drafts.txt'):
+        self.drafts_path = drafts_path
         self.generated_scripts = []
 
     def generate_scripts(self, trade_recaps, include_takeaways=True, include_lessons=True, include_next_steps=True, custom_headers=None, tags=None, tone='neutral', content_length='medium'):
@@ -82,13 +85,17 @@ class BatchContentGenerator:
         return f"Once upon a trade, a decision was made: {recap}"  # Basic narrative hook
 
     def auto_save_drafts(self):
-        with open('drafts.txt', 'w') as file:
+        with open(self.drafts_path, 'w') as file:
             for script in self.generated_scripts:
                 file.write(script + '\n---\n')
 
 class TestBatchContentGenerator(unittest.TestCase):
     def setUp(self):
-        self.generator = BatchContentGenerator()
+        # Each test saves its drafts into its own directory, so tests do not
+        # share (or leave behind) a drafts.txt in the working directory.
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.generator = BatchContentGenerator(os.path.join(tmp_dir.name, 'drafts.txt'))
 
     def test_generate_scripts_success(self):
         trade_recaps = ["Trade 1 recap", "Trade 2 recap"]
@@ -121,7 +128,7 @@ class TestBatchContentGenerator(unittest.TestCase):
     def test_auto_save_drafts(self):
         trade_recaps = ["Auto-save draft test"]
         self.generator.generate_scripts(trade_recaps)
-        with open('drafts.txt', 'r') as file:
+        with open(self.generator.drafts_path, 'r') as file:
             content = file.read()
         self.assertIn("Auto-save draft test", content)
 
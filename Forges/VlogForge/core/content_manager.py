@@ -39,20 +39,23 @@ class ContentManager:
                 break
         self.save_schedule()
 
-    def auto_update_status(self):
-        today = datetime.now().date()
+    def auto_update_status(self, today=None):
+        if today is None:
+            today = datetime.now().date()
         for content in self.content_schedule:
             post_date = datetime.strptime(content['Date'], '%Y-%m-%d').date()
             if content['Status'] == 'Scheduled' and post_date <= today:
                 content['Status'] = 'Posted'
         self.save_schedule()
 
-    def get_upcoming_content(self):
-        today = datetime.now().date()
+    def get_upcoming_content(self, today=None):
+        if today is None:
+            today = datetime.now().date()
         return [content for content in self.content_schedule if datetime.strptime(content['Date'], '%Y-%m-%d').date() > today]
 
-    def get_due_reminders(self, remind_before=0):
-        today = datetime.now().date()
+    def get_due_reminders(self, remind_before=0, today=None):
+        if today is None:
+            today = datetime.now().date()
         reminder_date = today + timedelta(days=remind_before)
 
         return [
@@ -85,5 +88,9 @@ class ContentManager:
         :param content_list: List of content scripts or titles to be scheduled.
         """
         today = datetime.now().strftime('%Y-%m-%d')
-        for item in content_list:
-            self.add_content(date=today, title=item[:30], status='Scheduled')
+        # Append every item first and write the CSV once, rather than
+        # rewriting the whole file for each add_content call.
+        self.content_schedule.extend(
+            {'Date': today, 'Title': item[:30], 'Status': 'Scheduled'} for item in content_list
+        )
+        self.save_schedule()
@@ -55,16 +55,22 @@ class EngagementHeatmap:
         plt.show()
 
 class TestEngagementHeatmap(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._sample_data = pd.DataFrame({
+            'timestamp': [datetime(2024, 4, 1, 12), datetime(2024, 4, 3, 14)],
+            'engagement': [100, 150],
+            'type': ['like', 'comment']
+        })
+
     def setUp(self):
         self.heatmap = EngagementHeatmap()
+        # add_engagement_data converts the 'timestamp' column in place, so
+        # each test gets its own copy of the class-level frame.
+        self.sample_data = self._sample_data.copy()
 
     def test_add_engagement_data_success(self):
-        data = pd.DataFrame({
-            'timestamp': [datetime(2024, 4, 1, 12), datetime(2024, 4, 2, 14)],
-            'engagement': [100, 150],
-            'type': ['like', 'comment']
-        })
-        self.heatmap.add_engagement_data(data)
+        self.heatmap.add_engagement_data(self.sample_data)
         self.assertEqual(len(self.heatmap.engagement_data), 2)
 
     def test_add_engagement_data_invalid_format(self):
@@ -84,32 +90,17 @@ class TestEngagementHeatmap(unittest.TestCase):
             self.heatmap.generate_heatmap()
 
     def test_generate_heatmap_success(self):
-        data = pd.DataFrame({
-            'timestamp': [datetime(2024, 4, 1, 12), datetime(2024, 4, 2, 14)],
-            'engagement': [100, 150],
-            'type': ['like', 'comment']
-        })
-        self.heatmap.add_engagement_data(data)
+        self.heatmap.add_engagement_data(self.sample_data)
         # This should not raise an error
         self.heatmap.generate_heatmap()
 
     def test_filter_by_date_range(self):
-        data = pd.DataFrame({
-            'timestamp': [datetime(2024, 4, 1, 12), datetime(2024, 4, 3, 14)],
-            'engagement': [100, 150],
-            'type': ['like', 'comment']
-        })
-        self.heatmap.add_engagement_data(data)
+        self.heatmap.add_engagement_data(self.sample_data)
         filtered_data = self.heatmap.filter_data(start_date='2024-04-02')
         self.assertEqual(len(filtered_data), 1)
 
     def test_filter_by_engagement_type(self):
-        data = pd.DataFrame({
-            'timestamp': [datetime(2024, 4, 1, 12), datetime(2024, 4, 2, 14)],
-            'engagement': [100, 150],
-            'type': ['like', 'comment']
-        })
-        self.heatmap.add_engagement_data(data)
+        self.heatmap.add_engagement_data(self.sample_data)
         filtered_data = self.heatmap.filter_data(engagement_type='comment')
         self.assertEqual(len(filtered_data), 1)
 
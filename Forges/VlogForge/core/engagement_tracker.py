@@ -10,22 +10,24 @@ class EngagementTracker:
             for entry in data if entry['Views'] > 0
         ]
 
-    def analyze_growth_trend(self, data):
+    def analyze_growth_trend(self, data, rates=None):
         if not data:
             return {'average_engagement_rate': 0, 'growth_trend': []}
-        rates = self.calculate_engagement_rates(data)
+        if rates is None:
+            rates = self.calculate_engagement_rates(data)
         avg_rate = sum(rates) / len(rates) if rates else 0
         growth_trend = [{'Date': entry['Date'], 'EngagementRate': rate} for entry, rate in zip(data, rates)]
         return {'average_engagement_rate': round(avg_rate, 2), 'growth_trend': growth_trend}
 
-    def get_top_performing_content(self, data):
+    def get_top_performing_content(self, data, rates=None):
         if not data:
             return None
-        rates = self.calculate_engagement_rates(data)
+        if rates is None:
+            rates = self.calculate_engagement_rates(data)
         max_rate_index = rates.index(max(rates)) if rates else -1
         return data[max_rate_index] if max_rate_index >= 0 else None
 
-    def generate_engagement_heatmap(self, data):
+    def generate_engagement_heatmap(self, data, rates=None):
         if not data:
             return pd.DataFrame()
         df = pd.DataFrame(data)
@@ -34,7 +36,7 @@ class EngagementTracker:
         df['DayOfWeek'] = df['Date'].dt.day_name()
         df['Hour'] = df['Date'].dt.hour
         if 'EngagementRate' not in df.columns:
-            df['EngagementRate'] = self.calculate_engagement_rates(data)
+            df['EngagementRate'] = rates if rates is not None else self.calculate_engagement_rates(data)
         all_hours = list(range(24))
         df = df.set_index(['DayOfWeek', 'Hour']).reindex(
             pd.MultiIndex.from_product([df['DayOfWeek'].unique(), all_hours], names=['DayOfWeek', 'Hour']),
@@ -54,14 +56,15 @@ class EngagementTracker:
         """
         Track engagement metrics for the provided content data.
         Aggregates engagement rates, growth trends, and identifies top-performing content.
+        Engagement rates are computed once and shared by every aggregate.
         """
         if not content_data:
             return {"message": "No content data provided."}
 
         engagement_rates = self.calculate_engagement_rates(content_data)
-        growth_trend = self.analyze_growth_trend(content_data)
-        top_content = self.get_top_performing_content(content_data)
-        heatmap = self.generate_engagement_heatmap(content_data)
+        growth_trend = self.analyze_growth_trend(content_data, engagement_rates)
+        top_content = self.get_top_performing_content(content_data, engagement_rates)
+        heatmap = self.generate_engagement_heatmap(content_data, engagement_rates)
 
         return {
             "engagement_rates": engagement_rates,
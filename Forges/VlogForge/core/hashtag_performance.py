@@ -1,6 +1,5 @@
 import unittest
 import pandas as pd
-from collections import defaultdict
 
 class HashtagPerformanceTracker:
     def __init__(self):
@@ -77,15 +76,21 @@ class HashtagPerformanceTracker:
         return platform_data
 
 class TestHashtagPerformanceTracker(unittest.TestCase):
-    def setUp(self):
-        self.tracker = HashtagPerformanceTracker()
-        self.sample_data = pd.DataFrame({
+    @classmethod
+    def setUpClass(cls):
+        cls._sample_data = pd.DataFrame({
             "hashtag": ["#AI", "#Tech", "#AI", "#Growth", "#Tech"],
             "engagement": [100, 200, 150, 80, 300],
             "date": ["2024-04-01", "2024-04-02", "2024-04-03", "2024-04-04", "2024-04-05"],
             "platform": ["Twitter", "Instagram", "Twitter", "Facebook", "Instagram"]
         })
 
+    def setUp(self):
+        self.tracker = HashtagPerformanceTracker()
+        # add_hashtag_data converts the 'date' column in place, so each test
+        # gets its own copy of the class-level frame.
+        self.sample_data = self._sample_data.copy()
+
     def test_add_hashtag_data_success(self):
         self.tracker.add_hashtag_data(self.sample_data)
         self.assertEqual(len(self.tracker.hashtag_data), 5)
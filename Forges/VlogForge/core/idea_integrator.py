@@ -4,9 +4,9 @@ from datetime import datetime
 from core.social_media_analyzer import SocialMediaAnalyzer
 
 class IdeaIntegrator:
-    def __init__(self):
-        self.idea_vault = IdeaVault()
-        self.social_media_analyzer = SocialMediaAnalyzer()
+    def __init__(self, idea_vault=None, social_media_analyzer=None):
+        self.idea_vault = idea_vault if idea_vault is not None else IdeaVault()
+        self.social_media_analyzer = social_media_analyzer if social_media_analyzer is not None else SocialMediaAnalyzer()
 
     def suggest_optimal_schedule(self, idea_id):
         idea = next((idea for idea in self.idea_vault.get_ideas() if idea['id'] == idea_id), None)
@@ -29,20 +29,26 @@ class IdeaIntegrator:
         return None
 
 # Unit Tests
-import unittest
 import os
-from unittest.mock import patch, MagicMock
+import tempfile
+import unittest
+from unittest.mock import create_autospec
 
 class TestIdeaIntegrator(unittest.TestCase):
-    def setUp(self):
-        self.integrator = IdeaIntegrator()
-        self.vault = self.integrator.idea_vault
-        self.vault.ideas = []
-        self.vault._save_ideas()
+    @classmethod
+    def setUpClass(cls):
+        # Building the autospec walks SocialMediaAnalyzer once; each test
+        # resets the shared stand-in instead of building a new one.
+        cls.analyzer = create_autospec(SocialMediaAnalyzer, instance=True)
 
-    def tearDown(self):
-        if os.path.exists('data/idea_vault.json'):
-            os.remove('data/idea_vault.json')
+    def setUp(self):
+        # Inject a vault backed by a throwaway file instead of loading and
+        # then deleting the real data/idea_vault.json on every test.
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.vault = IdeaVault(os.path.join(tmp_dir.name, 'idea_vault.json'))
+        self.analyzer.reset_mock(return_value=True, side_effect=True)
+        self.integrator = IdeaIntegrator(idea_vault=self.vault, social_media_analyzer=self.analyzer)
 
     def test_suggest_optimal_schedule(self):
         idea = self.vault.add_idea('Test Idea', 'Description')
@@ -54,13 +60,14 @@ class TestIdeaIntegrator(unittest.TestCase):
         updated_idea = self.integrator.push_idea_to_schedule(idea['id'])
         self.assertEqual(updated_idea['status'], 'scheduled')
 
-    @patch('core.social_media_analyzer.SocialMediaAnalyzer.scrape_stocktwits_post')
-    def test_analyze_social_sentiment(self, mock_scrape):
-        mock_scrape.return_value = {'title': 'AAPL', 'description': 'Test description', 'post': 'Positive sentiment!', 'sentiment': 0.8}
+    def test_analyze_social_sentiment(self):
+        scraped = {'title': 'AAPL', 'description': 'Test description', 'post': 'Positive sentiment!', 'sentiment': 0.8}
         idea = self.vault.add_idea('AAPL', 'Analyze sentiment for Apple stock.')
+        self.analyzer.scrape_stocktwits_post.return_value = scraped
         sentiment_data = self.integrator.analyze_social_sentiment(idea['id'])
         self.assertIsNotNone(sentiment_data)
         self.assertEqual(sentiment_data['sentiment'], 0.8)
+        self.analyzer.scrape_stocktwits_post.assert_called_once_with('AAPL', 'Analyze sentiment for Apple stock.')
 
 if __name__ == '__main__':
     unittest.main()
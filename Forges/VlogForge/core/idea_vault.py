@@ -1,8 +1,12 @@
 # core/idea_vault.py
-import json
 import os
 from datetime import datetime
+import tempfile
 import unittest
+try:
+    from .json_io import read_json_bytes, write_json_bytes
+except ImportError:  # run directly as a script
+    from json_io import read_json_bytes, write_json_bytes
 
 class IdeaVault:
     def __init__(self, storage_path='data/idea_vault.json'):
@@ -11,13 +15,11 @@ class IdeaVault:
 
     def _load_ideas(self):
         if os.path.exists(self.storage_path):
-            with open(self.storage_path, 'r') as file:
-                return json.load(file)
+            return read_json_bytes(self.storage_path)
         return []
 
     def _save_ideas(self):
-        with open(self.storage_path, 'w') as file:
-            json.dump(self.ideas, file, indent=4)
+        write_json_bytes(self.storage_path, self.ideas)
 
     def add_idea(self, title, description, tags=None):
         idea = {
@@ -58,13 +60,11 @@ class IdeaVault:
 # Unit Tests
 class TestIdeaVault(unittest.TestCase):
     def setUp(self):
-        self.vault = IdeaVault('test_idea_vault.json')
-        self.vault.ideas = []  # Clear existing ideas
-        self.vault._save_ideas()
-
-    def tearDown(self):
-        if os.path.exists('test_idea_vault.json'):
-            os.remove('test_idea_vault.json')
+        # Each test gets its own directory, so nothing is shared with other
+        # tests (or parallel workers) and there is nothing to clear first.
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.vault = IdeaVault(os.path.join(tmp_dir.name, 'test_idea_vault.json'))
 
     def test_add_idea(self):
         idea = self.vault.add_idea('Test Idea', 'Test Description')
@@ -0,0 +1,70 @@
+# core/json_io.py
+"""
+Shared JSON file I/O for the Vlog Forge stores (A/B tests, idea vault,
+content calendar). orjson is used when installed, but the bytes written
+are the same either way, and anything orjson cannot encode falls back to
+the stdlib.
+"""
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+try:
+    import orjson
+except ImportError:  # optional speedup, fall back to the stdlib
+    orjson = None
+
+
+def dumps_json_bytes(data):
+    """Encode data as indented UTF-8 JSON bytes."""
+    if orjson:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:  # e.g. numpy scalars, which the stdlib accepts
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def read_json_bytes(path):
+    """Read and decode the JSON file at path."""
+    with open(path, 'rb') as file:
+        raw = file.read()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def write_json_bytes(path, data):
+    """Encode data and write it to path; the file is untouched if encoding fails."""
+    raw = dumps_json_bytes(data)
+    with open(path, 'wb') as file:
+        file.write(raw)
+
+
+class TestJsonIO(unittest.TestCase):
+    sample = {"title": "Café vlog", "tags": [], "meta": {}, "views": [1, 2.5]}
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.path = os.path.join(tmp_dir.name, 'data.json')
+
+    def test_round_trip(self):
+        write_json_bytes(self.path, self.sample)
+        self.assertEqual(read_json_bytes(self.path), self.sample)
+
+    def test_same_bytes_with_and_without_orjson(self):
+        with_orjson = dumps_json_bytes(self.sample)
+        with patch(f'{__name__}.orjson', None):
+            without_orjson = dumps_json_bytes(self.sample)
+        self.assertEqual(with_orjson, without_orjson)
+
+    def test_failed_encode_leaves_file_untouched(self):
+        write_json_bytes(self.path, self.sample)
+        with self.assertRaises(TypeError):
+            write_json_bytes(self.path, {"bad": object()})
+        self.assertEqual(read_json_bytes(self.path), self.sample)
+
+
+if __name__ == '__main__':
+    unittest.main()
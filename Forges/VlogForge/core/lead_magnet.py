@@ -1,20 +1,19 @@
 import re
-import time
 from datetime import datetime, timedelta
 import requests
-import unittest
 from dotenv import load_dotenv
 import os
 import hashlib
 
 # Explicit path to the .env file
-dotenv_path = os.path.join(os.path.dirname(__file__), '...', '.env')
+dotenv_path = os.path.join(os.path.dirname(__file__), '..', '.env')
 load_dotenv(dotenv_path)
 
 MAILCHIMP_API_KEY = os.getenv("MAILCHIMP_API_KEY")
 MAILCHIMP_SERVER_PREFIX = os.getenv("MAILCHIMP_SERVER_PREFIX")
 MAILCHIMP_LIST_ID = os.getenv("MAILCHIMP_LIST_ID")
 MAILCHIMP_API_ENDPOINT = f"https://{MAILCHIMP_SERVER_PREFIX}.api.mailchimp.com/3.0/lists/{MAILCHIMP_LIST_ID}/members"
+EMAIL_PATTERN = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
 
 # Check if required env variables are set
 if not MAILCHIMP_API_KEY or not MAILCHIMP_SERVER_PREFIX:
@@ -27,7 +26,7 @@ class LeadMagnet:
         self.follow_up_days = 3  # Default follow-up days
 
     def is_valid_email(self, email):
-        return re.match(r"[^@\s]+@[^@\s]+\.[^@\s]+", email)
+        return EMAIL_PATTERN.match(email)
 
     def send_resource(self, email):
         if not email:
@@ -101,51 +100,3 @@ class LeadMagnet:
         except Exception as e:
             print(f"Error sending email to {email}: {e}")
             return False
-
-# Unit Test for LeadMagnet
-class TestLeadMagnet(unittest.TestCase):
-    def setUp(self):
-        self.lead_magnet = LeadMagnet()
-        self.mock_leads = [
-            {"email": "dadudekc@gmail.com", "status": "new"},
-            {"email": "dadudekc@gmail.com", "status": "new"}
-        ]
-
-    def test_send_resource_success(self):
-        response = self.lead_magnet.send_resource(self.mock_leads[0]["email"])
-        self.assertTrue(response["success"])
-        self.assertEqual(response["message"], "Resource sent successfully.")
-
-    def test_send_resource_invalid_email(self):
-        response = self.lead_magnet.send_resource("invalid-email")
-        self.assertFalse(response["success"])
-        self.assertEqual(response["message"], "Invalid email address.")
-
-    def test_track_conversion(self):
-        self.lead_magnet.track_conversion(self.mock_leads[0]["email"])
-        lead = self.lead_magnet.get_lead(self.mock_leads[0]["email"])
-        self.assertEqual(lead["status"], "converted")
-        self.assertEqual(lead["lead_score"], 10)
-
-    def test_prevent_duplicate_emails(self):
-        self.lead_magnet.send_resource(self.mock_leads[0]["email"])
-        response = self.lead_magnet.send_resource(self.mock_leads[0]["email"])
-        self.assertFalse(response["success"])
-        self.assertEqual(response["message"], "Resource already sent to this email.")
-
-    def test_handle_missing_data(self):
-        response = self.lead_magnet.send_resource("")
-        self.assertFalse(response["success"])
-        self.assertEqual(response["message"], "Email address is required.")
-
-    def test_send_follow_up_emails(self):
-        self.lead_magnet.send_resource(self.mock_leads[0]["email"])
-        self.lead_magnet.leads[self.mock_leads[0]["email"]]['last_contacted'] -= timedelta(days=4)
-
-        self.lead_magnet.send_follow_up_emails()
-        lead = self.lead_magnet.get_lead(self.mock_leads[0]["email"])
-        self.assertTrue(lead['last_contacted'] > datetime.now() - timedelta(days=1))
-        self.assertEqual(lead['lead_score'], 1)
-
-if __name__ == '__main__':
-    unittest.main()
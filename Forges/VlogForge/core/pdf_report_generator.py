@@ -8,10 +8,12 @@ summary insights, and a performance chart.
 """
 
 import os
+import tempfile
 from fpdf import FPDF
 from PyPDF2 import PdfReader
 import matplotlib.pyplot as plt
 from datetime import datetime
+from types import MappingProxyType
 import unittest
 
 
@@ -152,34 +154,36 @@ def generate_pdf_report(data, period, output_path, previous_data=None):
 # ===========================
 
 class TestPDFReportGenerator(unittest.TestCase):
-    def setUp(self):
-        self.test_data = {
-            "likes": 100,
-            "comments": 50,
-            "shares": 20,
-            "views": 1000,
-            "ctr": 5.5,
-            "engagement_rate": 10.2
-        }
-        self.previous_data = {
-            "likes": 80,
-            "comments": 40,
-            "shares": 25,
-            "views": 950,
-            "ctr": 4.8,
-            "engagement_rate": 9.5
-        }
-        self.output_file = "test_report.pdf"
-        if os.path.exists(self.output_file):
-            os.remove(self.output_file)
+    # Shared by every test; read-only views guard against a test mutating them.
+    test_data = MappingProxyType({
+        "likes": 100,
+        "comments": 50,
+        "shares": 20,
+        "views": 1000,
+        "ctr": 5.5,
+        "engagement_rate": 10.2
+    })
+    previous_data = MappingProxyType({
+        "likes": 80,
+        "comments": 40,
+        "shares": 25,
+        "views": 950,
+        "ctr": 4.8,
+        "engagement_rate": 9.5
+    })
 
-    def tearDown(self):
-        if os.path.exists(self.output_file):
-            os.remove(self.output_file)
+    def setUp(self):
+        # The report and its temporary chart image go into a fresh directory
+        # per test, removed in one go afterwards.
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.output_file = os.path.join(tmp_dir.name, "test_report.pdf")
 
     def test_generate_weekly_report_with_trends(self):
         generate_pdf_report(self.test_data, "weekly", self.output_file, self.previous_data)
         self.assertTrue(os.path.exists(self.output_file))
+        # The intermediate chart image is removed once embedded in the PDF
+        self.assertFalse(os.path.exists(self.output_file.replace('.pdf', '_chart.png')))
         reader = PdfReader(self.output_file)
         extracted_text = "".join([page.extract_text() for page in reader.pages])
         self.assertIn("Trend Analysis:", extracted_text)
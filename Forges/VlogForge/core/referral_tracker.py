@@ -22,6 +22,8 @@ class ReferralManager:
         self.data_dir = data_dir if data_dir else os.path.join(os.getcwd(), "data")
         os.makedirs(self.data_dir, exist_ok=True)
         self.referral_data_file = os.path.join(self.data_dir, filename)
+        # (mtime_ns, size) of the CSV and the rows parsed from it.
+        self._read_cache = None
         self._ensure_file()
 
     def _ensure_file(self):
@@ -36,6 +38,7 @@ class ReferralManager:
         """
         Self-healing method that (re)creates the CSV file with the correct header.
         """
+        self._read_cache = None
         try:
             with open(self.referral_data_file, mode='w', newline='') as file:
                 writer = csv.DictWriter(file, fieldnames=self.FIELDNAMES)
@@ -48,14 +51,19 @@ class ReferralManager:
         """
         Reads and returns the referral data from the CSV file.
         If the file is corrupt or the header is not as expected, the CSV is healed.
+        Parsed rows are cached until the file's mtime or size changes; callers
+        always receive fresh copies they are free to mutate.
         """
         try:
-            with open(self.referral_data_file, mode='r', newline='') as file:
-                reader = csv.DictReader(file)
-                if reader.fieldnames != self.FIELDNAMES:
-                    raise ValueError("CSV header mismatch; healing file.")
-                data = list(reader)
-            return data
+            stat = os.stat(self.referral_data_file)
+            key = (stat.st_mtime_ns, stat.st_size)
+            if self._read_cache is None or self._read_cache[0] != key:
+                with open(self.referral_data_file, mode='r', newline='') as file:
+                    reader = csv.DictReader(file)
+                    if reader.fieldnames != self.FIELDNAMES:
+                        raise ValueError("CSV header mismatch; healing file.")
+                    self._read_cache = (key, list(reader))
+            return [dict(row) for row in self._read_cache[1]]
         except Exception as e:
             logging.error("Error reading CSV file: " + str(e))
             self._heal_csv_file()
@@ -65,6 +73,7 @@ class ReferralManager:
         """
         Writes the provided referral data to the CSV file.
         """
+        self._read_cache = None
         try:
             with open(self.referral_data_file, mode='w', newline='') as file:
                 writer = csv.DictWriter(file, fieldnames=self.FIELDNAMES)
@@ -92,6 +101,7 @@ class ReferralManager:
                 'incentive_awarded': incentive_awarded
             }
             # Append new referral in append mode
+            self._read_cache = None
             with open(self.referral_data_file, mode='a', newline='') as file:
                 writer = csv.DictWriter(file, fieldnames=self.FIELDNAMES)
                 # If the file is empty (or just healed), write the header.
@@ -1,18 +1,22 @@
 from textblob import TextBlob
+import builtins
 import csv
+import os
+import tempfile
 import requests
 from bs4 import BeautifulSoup
 from concurrent.futures import ThreadPoolExecutor
 import matplotlib.pyplot as plt
-from unittest.mock import patch, Mock
+from types import SimpleNamespace
+from unittest.mock import patch
 import unittest
-import pandas as pd
 
 
 class SocialMediaAnalyzer:
-    def __init__(self, keywords=None):
+    def __init__(self, keywords=None, output_dir='.'):
         self.headers = {'User-Agent': 'Mozilla/5.0'}
         self.keywords = keywords or []  # Add keyword filter
+        self.output_dir = output_dir  # Where reports, graphs and summaries are written
 
     def scrape_stocktwits_post(self, title, description):
         url = f'https://stocktwits.com/symbol/{title}'
@@ -59,7 +63,7 @@ class SocialMediaAnalyzer:
         return any(keyword.lower() in text.lower() for keyword in self.keywords)
 
     def save_data(self, title, data):
-        with open(f'{title}_report.csv', 'w', newline='') as file:
+        with open(os.path.join(self.output_dir, f'{title}_report.csv'), 'w', newline='') as file:
             writer = csv.DictWriter(file, fieldnames=['title', 'description', 'post', 'sentiment'])
             writer.writeheader()
             writer.writerows(data)
@@ -78,7 +82,7 @@ class SocialMediaAnalyzer:
         plt.ylabel('Sentiment Score')
         plt.xticks(rotation=45)
         plt.tight_layout()
-        plt.savefig(f'{title}_sentiment_graph.png')
+        plt.savefig(os.path.join(self.output_dir, f'{title}_sentiment_graph.png'))
         plt.close()
 
     def generate_summary_report(self, title, data):
@@ -99,16 +103,19 @@ class SocialMediaAnalyzer:
         )
 
         print(summary)
-        with open(f'{title}_summary_report.txt', 'w') as file:
+        with open(os.path.join(self.output_dir, f'{title}_summary_report.txt'), 'w') as file:
             file.write(summary)
 
-class TestSocialMediaAnalyzer(unittest.TestCase):
-    @patch('requests.get')
-    def test_scrape_stocktwits_post(self, mock_get):
-        analyzer = SocialMediaAnalyzer(keywords=['content'])
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.text = '''
+def _canned_response(text='', status_code=200, error=None):
+    """Build a stand-in for requests.Response carrying only what scrape_generic reads."""
+    def raise_for_status():
+        if error is not None:
+            raise error
+    return SimpleNamespace(status_code=status_code, text=text, raise_for_status=raise_for_status)
+
+
+# Responses are only read by scrape_generic, so they are built once and shared.
+THREE_MATCHING_POSTS = _canned_response('''
         <html>
             <body>
                 <p class="st_3rd_party_message_content">Post 1 content</p>
@@ -117,81 +124,83 @@ class TestSocialMediaAnalyzer(unittest.TestCase):
                 <p class="st_3rd_party_message_content">Irrelevant post</p>
             </body>
         </html>
-        '''
-        mock_get.return_value = mock_response
-
-        with patch('builtins.print') as mock_print:
-            analyzer.scrape_stocktwits_post('AAPL', 'Description')
-
-            mock_print.assert_any_call('AAPL Post: Post 1 content | Sentiment: 0.0')
-            mock_print.assert_any_call('AAPL Post: Post 2 content | Sentiment: 0.0')
-            mock_print.assert_any_call('AAPL Post: Post 3 content | Sentiment: 0.0')
-            self.assertGreaterEqual(mock_print.call_count, 3)
-
-    @patch('requests.get')
-    def test_no_keyword_match(self, mock_get):
-        analyzer = SocialMediaAnalyzer(keywords=['unmatched'])
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.text = '''
+        ''')
+UNMATCHED_POST = _canned_response('''
         <html>
             <body>
                 <p class="st_3rd_party_message_content">Post without matching keyword</p>
             </body>
         </html>
-        '''
-        mock_get.return_value = mock_response
-
-        with patch('builtins.print') as mock_print:
-            analyzer.scrape_stocktwits_post('AAPL', 'Description')
-            mock_print.assert_not_called()  # No print calls expected
-
-    @patch('requests.get')
-    def test_multiple_keywords_match(self, mock_get):
-        analyzer = SocialMediaAnalyzer(keywords=['content', 'Post'])
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.text = '''
+        ''')
+MULTI_KEYWORD_POSTS = _canned_response('''
         <html>
             <body>
                 <p class="st_3rd_party_message_content">Post 1 with content</p>
                 <p class="st_3rd_party_message_content">Another Post about content</p>
             </body>
         </html>
-        '''
-        mock_get.return_value = mock_response
-
-        with patch('builtins.print') as mock_print:
-            analyzer.scrape_stocktwits_post('AAPL', 'Description')
-
-            mock_print.assert_any_call('AAPL Post: Post 1 with content | Sentiment: 0.0')
-            mock_print.assert_any_call('AAPL Post: Another Post about content | Sentiment: 0.0')
-            self.assertEqual(mock_print.call_count, 3)
-
-    @patch('requests.get')
-    def test_empty_response_handling(self, mock_get):
-        analyzer = SocialMediaAnalyzer()
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.text = ''  # Empty response
-        mock_get.return_value = mock_response
-
-        with patch('builtins.print') as mock_print:
-            analyzer.scrape_stocktwits_post('AAPL', 'Description')
-            mock_print.assert_called_once_with('No content available to parse.')
-
-    @patch('requests.get')
-    def test_scrape_stocktwits_post_failure(self, mock_get):
-        analyzer = SocialMediaAnalyzer()
-        mock_response = Mock()
-        mock_response.status_code = 404
-        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError()
-        mock_get.return_value = mock_response
-
-        with patch('builtins.print') as mock_print:
-            analyzer.scrape_stocktwits_post('AAPL', 'Description')
-
-            mock_print.assert_called_once_with('Failed to scrape AAPL.')
+        ''')
+EMPTY_RESPONSE = _canned_response('')
+NOT_FOUND_RESPONSE = _canned_response(status_code=404, error=requests.exceptions.HTTPError())
+
+
+class TestSocialMediaAnalyzer(unittest.TestCase):
+    def setUp(self):
+        # Every test stubs the HTTP call and captures print output, so both
+        # patches are started once here rather than stacked on each test.
+        get_patcher = patch.object(requests, 'get')
+        self.mock_get = get_patcher.start()
+        self.addCleanup(get_patcher.stop)
+        print_patcher = patch.object(builtins, 'print')
+        self.mock_print = print_patcher.start()
+        self.addCleanup(print_patcher.stop)
+        # Reports land in a per-test directory that is removed as a whole,
+        # instead of piling up AAPL_* files in the working directory.
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.output_dir = tmp_dir.name
+
+    def test_scrape_stocktwits_post(self):
+        analyzer = SocialMediaAnalyzer(keywords=['content'], output_dir=self.output_dir)
+        self.mock_get.return_value = THREE_MATCHING_POSTS
+
+        analyzer.scrape_stocktwits_post('AAPL', 'Description')
+
+        self.mock_print.assert_any_call('AAPL Post: Post 1 content | Sentiment: 0.0')
+        self.mock_print.assert_any_call('AAPL Post: Post 2 content | Sentiment: 0.0')
+        self.mock_print.assert_any_call('AAPL Post: Post 3 content | Sentiment: 0.0')
+        self.assertGreaterEqual(self.mock_print.call_count, 3)
+
+    def test_no_keyword_match(self):
+        analyzer = SocialMediaAnalyzer(keywords=['unmatched'], output_dir=self.output_dir)
+        self.mock_get.return_value = UNMATCHED_POST
+
+        analyzer.scrape_stocktwits_post('AAPL', 'Description')
+        self.mock_print.assert_not_called()  # No print calls expected
+
+    def test_multiple_keywords_match(self):
+        analyzer = SocialMediaAnalyzer(keywords=['content', 'Post'], output_dir=self.output_dir)
+        self.mock_get.return_value = MULTI_KEYWORD_POSTS
+
+        analyzer.scrape_stocktwits_post('AAPL', 'Description')
+
+        self.mock_print.assert_any_call('AAPL Post: Post 1 with content | Sentiment: 0.0')
+        self.mock_print.assert_any_call('AAPL Post: Another Post about content | Sentiment: 0.0')
+        self.assertEqual(self.mock_print.call_count, 3)
+
+    def test_empty_response_handling(self):
+        analyzer = SocialMediaAnalyzer(output_dir=self.output_dir)
+        self.mock_get.return_value = EMPTY_RESPONSE
+
+        analyzer.scrape_stocktwits_post('AAPL', 'Description')
+        self.mock_print.assert_called_once_with('No content available to parse.')
+
+    def test_scrape_stocktwits_post_failure(self):
+        analyzer = SocialMediaAnalyzer(output_dir=self.output_dir)
+        self.mock_get.return_value = NOT_FOUND_RESPONSE
+
+        analyzer.scrape_stocktwits_post('AAPL', 'Description')
+        self.mock_print.assert_called_once_with('Failed to scrape AAPL.')
 
 if __name__ == '__main__':
     unittest.main()
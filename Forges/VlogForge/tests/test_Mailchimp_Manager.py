@@ -1,13 +1,22 @@
 import unittest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
+
+try:
+    import mailchimp_marketing  # noqa: F401
+except ImportError:
+    raise unittest.SkipTest("mailchimp_marketing is not installed")
+
+from VlogForge.api_intergrations import mailchimp_api
 from VlogForge.api_intergrations.mailchimp_api import MailchimpManager
 
 
 class TestMailchimpManager(unittest.TestCase):
 
-    @patch('VlogForge.api_intergrations.mailchimp_api.Client')
-    def setUp(self, mock_client):
-        self.mock_client = mock_client.return_value
+    def setUp(self):
+        # Keep Client patched for the whole test, not just while setUp runs
+        client_patcher = patch.object(mailchimp_api, 'Client')
+        self.mock_client = client_patcher.start().return_value
+        self.addCleanup(client_patcher.stop)
         self.mailchimp = MailchimpManager()
 
     def test_add_subscriber_success(self):
@@ -1,21 +1,40 @@
 import unittest
-from datetime import datetime, timedelta
+from datetime import date, timedelta
+from unittest.mock import patch
 from VlogForge.core.content_manager import ContentManager
 
+# Fixed "today" passed to the date-based methods so results do not depend
+# on when the suite runs.
+TODAY = date(2025, 3, 1)
+
 
 class TestContentManager(unittest.TestCase):
     def setUp(self):
-        # Use an in-memory list instead of an actual file for testing
+        # Use an in-memory list instead of an actual file for testing:
+        # loading starts from an empty schedule and saving is stubbed out,
+        # so the tests never touch the filesystem.
+        load_patcher = patch.object(ContentManager, 'load_schedule', return_value=[])
+        load_patcher.start()
+        self.addCleanup(load_patcher.stop)
+        save_patcher = patch.object(ContentManager, 'save_schedule')
+        self.mock_save = save_patcher.start()
+        self.addCleanup(save_patcher.stop)
+
         self.manager = ContentManager(schedule_file='test_content_schedule.csv')
-        self.manager.content_schedule = []  # Clear schedule before each test
 
     def test_add_and_auto_update_content(self):
-        today = datetime.now().strftime('%Y-%m-%d')
-        self.manager.add_content(today, 'Auto Update Test', 'Scheduled')
-        self.manager.auto_update_status()
+        self.manager.add_content(TODAY.isoformat(), 'Auto Update Test', 'Scheduled')
+        self.manager.auto_update_status(today=TODAY)
         content = self.manager.content_schedule[0]
         self.assertEqual(content['Status'], 'Posted')
 
+    def test_schedule_content_saves_once(self):
+        self.manager.schedule_content(['First script', 'Second script', 'Third script'])
+        self.assertEqual([c['Title'] for c in self.manager.content_schedule],
+                         ['First script', 'Second script', 'Third script'])
+        self.assertTrue(all(c['Status'] == 'Scheduled' for c in self.manager.content_schedule))
+        self.mock_save.assert_called_once_with()
+
     def test_suggest_optimal_time_with_content_addition(self):
         engagement_data = [
             {"Date": "2025-02-01", "Time": "10:00", "Engagement": 50},
@@ -29,22 +48,22 @@ class TestContentManager(unittest.TestCase):
         self.assertIn(optimal_time, added_content['Title'])
 
     def test_due_reminders_with_custom_interval(self):
-        future_date = (datetime.now() + timedelta(days=1)).strftime('%Y-%m-%d')
+        future_date = (TODAY + timedelta(days=1)).isoformat()
         self.manager.add_content(future_date, 'Reminder Test', 'Scheduled')
-        reminders = self.manager.get_due_reminders(remind_before=1)
+        reminders = self.manager.get_due_reminders(remind_before=1, today=TODAY)
         self.assertEqual(len(reminders), 1)
         self.assertEqual(reminders[0]['Title'], 'Reminder Test')
 
     def test_no_reminders_for_past_content(self):
-        past_date = (datetime.now() - timedelta(days=2)).strftime('%Y-%m-%d')
+        past_date = (TODAY - timedelta(days=2)).isoformat()
         self.manager.add_content(past_date, 'Past Content', 'Scheduled')
-        reminders = self.manager.get_due_reminders()
+        reminders = self.manager.get_due_reminders(today=TODAY)
         self.assertEqual(len(reminders), 0)
 
     def test_upcoming_content(self):
-        future_date = (datetime.now() + timedelta(days=5)).strftime('%Y-%m-%d')
+        future_date = (TODAY + timedelta(days=5)).isoformat()
         self.manager.add_content(future_date, 'Upcoming Content')
-        upcoming = self.manager.get_upcoming_content()
+        upcoming = self.manager.get_upcoming_content(today=TODAY)
         self.assertEqual(len(upcoming), 1)
         self.assertEqual(upcoming[0]['Title'], 'Upcoming Content')
 
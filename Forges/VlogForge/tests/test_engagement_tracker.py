@@ -1,12 +1,16 @@
 import unittest
-from datetime import datetime
+from unittest.mock import patch
+import numpy as np
 from VlogForge.core.engagement_tracker import EngagementTracker
 
 
 class TestEngagementTracker(unittest.TestCase):
-    def setUp(self):
-        self.tracker = EngagementTracker()
-        self.mock_data = [
+    @classmethod
+    def setUpClass(cls):
+        # The tracker is stateless and no test mutates the data, so both are
+        # built once and shared by every test in the class.
+        cls.tracker = EngagementTracker()
+        cls.mock_data = [
             {"Date": "2025-02-01", "Views": 1000, "Likes": 150, "Comments": 20},
             {"Date": "2025-02-02", "Views": 800, "Likes": 120, "Comments": 15},
             {"Date": "2025-02-03", "Views": 1500, "Likes": 300, "Comments": 50},
@@ -22,9 +26,9 @@ class TestEngagementTracker(unittest.TestCase):
             (90 + 10) / 600 * 100
         ]
 
-        # Compare each rate with tolerance for floating-point precision
-        for actual, expected in zip(rates, expected_rates):
-            self.assertAlmostEqual(actual, expected, places=2)
+        # Compare all rates at once with tolerance for floating-point
+        # precision; a length mismatch fails too, unlike a zip loop
+        np.testing.assert_allclose(rates, expected_rates, rtol=0, atol=0.005)
 
     def test_generate_engagement_heatmap(self):
         heatmap = self.tracker.generate_engagement_heatmap(self.mock_data)
@@ -46,6 +50,14 @@ class TestEngagementTracker(unittest.TestCase):
         top_content = self.tracker.get_top_performing_content(self.mock_data)
         self.assertEqual(top_content['Date'], "2025-02-03")  # Highest engagement day
 
+    def test_track_computes_rates_once(self):
+        calculate = self.tracker.calculate_engagement_rates
+        with patch.object(self.tracker, 'calculate_engagement_rates', wraps=calculate) as spy:
+            result = self.tracker.track(self.mock_data)
+        spy.assert_called_once_with(self.mock_data)
+        self.assertEqual(result['top_performing_content']['Date'], "2025-02-03")
+        self.assertEqual(len(result['growth_trend']['growth_trend']), len(self.mock_data))
+
     def test_empty_data_handling(self):
         rates = self.tracker.calculate_engagement_rates([])
         self.assertEqual(rates, [])
@@ -0,0 +1,50 @@
+import csv
+import tempfile
+import unittest
+from unittest.mock import patch
+from VlogForge.core import referral_tracker
+from VlogForge.core.referral_tracker import ReferralManager
+
+
+class TestReferralReadCache(unittest.TestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.manager = ReferralManager(data_dir=tmp_dir.name)
+        self.manager.add_referral('user123', 'user456')
+
+        # Count how often the CSV is actually parsed.
+        reader_patcher = patch.object(referral_tracker.csv, 'DictReader', wraps=csv.DictReader)
+        self.mock_reader = reader_patcher.start()
+        self.addCleanup(reader_patcher.stop)
+
+    def test_second_read_reuses_parsed_rows(self):
+        first = self.manager._read_referral_data()
+        second = self.manager._read_referral_data()
+        self.assertEqual(first, second)
+        self.assertEqual(self.mock_reader.call_count, 1)
+
+    def test_add_referral_invalidates_cache(self):
+        self.manager._read_referral_data()
+        self.manager.add_referral('user123', 'user789')
+        rows = self.manager._read_referral_data()
+        self.assertEqual([r['referred_user'] for r in rows], ['user456', 'user789'])
+
+    def test_update_referral_status_invalidates_cache(self):
+        self.manager._read_referral_data()
+        self.manager.update_referral_status(1, 'completed')
+        rows = self.manager._read_referral_data()
+        self.assertEqual(rows[0]['referral_status'], 'completed')
+
+    def test_mutating_returned_rows_leaves_cache_intact(self):
+        rows = self.manager._read_referral_data()
+        rows[0]['referral_status'] = 'expired'
+        rows.append({'referral_id': '2'})
+        fresh = self.manager._read_referral_data()
+        self.assertEqual(len(fresh), 1)
+        self.assertEqual(fresh[0]['referral_status'], 'active')
+        self.assertEqual(self.mock_reader.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
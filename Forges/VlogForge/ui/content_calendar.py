@@ -1,30 +1,41 @@
 import json
 import os
+import sys
 from datetime import datetime, timedelta
 
+try:
+    from ..core.json_io import read_json_bytes, write_json_bytes
+except ImportError:  # imported as the top-level ui package, or run as a script
+    if not __package__:
+        sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from core.json_io import read_json_bytes, write_json_bytes
+
 class ContentCalendar:
     def __init__(self, storage_path='data/content_calendar.json'):
         self.storage_path = storage_path
-        self._ensure_file_exists()
-        self.calendar = self._load_calendar()
+        created = self._ensure_file_exists()
+        # A freshly created file holds an empty list; no need to read it back
+        self.calendar = [] if created else self._load_calendar()
 
     def _ensure_file_exists(self):
+        """Create the storage file if missing; return True if it was created."""
         # Handle case where storage_path is just a filename without a directory
         directory = os.path.dirname(self.storage_path)
-        if directory and not os.path.exists(directory):
+        if directory:
             os.makedirs(directory, exist_ok=True)
-        
-        if not os.path.exists(self.storage_path):
-            with open(self.storage_path, 'w') as file:
+
+        try:
+            with open(self.storage_path, 'x') as file:
                 json.dump([], file)  # Initialize with an empty list
+        except FileExistsError:
+            return False
+        return True
 
     def _load_calendar(self):
-        with open(self.storage_path, 'r') as file:
-            return json.load(file)
+        return read_json_bytes(self.storage_path)
 
     def _save_calendar(self):
-        with open(self.storage_path, 'w') as file:
-            json.dump(self.calendar, file, indent=4)
+        write_json_bytes(self.storage_path, self.calendar)
 
     def add_to_calendar(self, title, scheduled_date, reminder_days=1):
         event = {
@@ -86,16 +97,16 @@ class ContentCalendar:
 # Unit Tests for ContentCalendar
 # =======================
 
+import tempfile
 import unittest
 
 class TestContentCalendar(unittest.TestCase):
     def setUp(self):
-        self.calendar = ContentCalendar('test_content_calendar.json')
-        self.calendar.calendar = []  # Clear test data
-        self.calendar._save_calendar()
-
-    def tearDown(self):
-        os.remove('test_content_calendar.json')
+        # A fresh directory per test means the calendar starts empty and the
+        # whole directory is removed in one go afterwards.
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp_dir.cleanup)
+        self.calendar = ContentCalendar(os.path.join(self._tmp_dir.name, 'test_content_calendar.json'))
 
     def test_add_to_calendar(self):
         event = self.calendar.add_to_calendar('Test Event', '2024-02-15')
@@ -8,24 +8,36 @@ reports and logs for beta testing purposes.
 """
 
 import asyncio
+import atexit
 import json
 import logging
 import os
+import queue
 import sys
 import platform
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import Dict, List, Optional, Union
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('beta_verification.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
+# Configure logging: callers only enqueue records, a background listener
+# does the console/file I/O. The log file is not created until first write.
+_log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+_file_handler = RotatingFileHandler(
+    'beta_verification.log', maxBytes=1_000_000, backupCount=3, delay=True
 )
+_console_handler = logging.StreamHandler(sys.stdout)
+for _handler in (_file_handler, _console_handler):
+    _handler.setFormatter(_log_formatter)
+
+_log_queue = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, _file_handler, _console_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+_queue_handler = QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
 logger = logging.getLogger(__name__)
 
 class BetaVerifier:
@@ -1,16 +1,43 @@
 import ast
+import hashlib
 import subprocess
+import threading
+from collections import OrderedDict
 
 
 class SelfEvolver:
+    # Suggestions keyed by a digest of the analyzed source, so re-analyzing
+    # an unchanged file skips both the parse and the Ollama call. Only
+    # successful Ollama runs are kept, and the least recently used entries
+    # are evicted once the cache is full. The lock keeps lookups and
+    # evictions from concurrent callers consistent; it is not held while
+    # Ollama runs.
+    ANALYSIS_CACHE_SIZE = 128
+    _analysis_cache = OrderedDict()
+    _analysis_cache_lock = threading.Lock()
+
+    @staticmethod
+    def clear_analysis_cache():
+        """Forget all cached analysis results."""
+        with SelfEvolver._analysis_cache_lock:
+            SelfEvolver._analysis_cache.clear()
+
     @staticmethod
     def analyze_code(file_path: str):
         """Analyze a Python file and return improvement suggestions."""
-        suggestions = []
+        with open(file_path, 'rb') as file:
+            raw = file.read()
 
-        with open(file_path, 'r') as file:
-            file_content = file.read()
+        digest = hashlib.sha256(raw).hexdigest()
+        with SelfEvolver._analysis_cache_lock:
+            cached = SelfEvolver._analysis_cache.get(digest)
+            if cached is not None:
+                SelfEvolver._analysis_cache.move_to_end(digest)
+        if cached is not None:
+            return list(cached)
 
+        suggestions = []
+        file_content = raw.decode('utf-8')
         tree = ast.parse(file_content)
         for node in ast.walk(tree):
             if isinstance(node, ast.FunctionDef):
@@ -19,13 +46,25 @@ class SelfEvolver:
                 if len(node.body) > 20:
                     suggestions.append(f"Function '{node.name}' is too long. Consider splitting it.")
 
-        ai_suggestions = SelfEvolver.get_ai_suggestions(file_content)
+        ai_suggestions, succeeded = SelfEvolver._run_mistral(file_content)
         suggestions.extend(ai_suggestions)
+        if succeeded:
+            with SelfEvolver._analysis_cache_lock:
+                cache = SelfEvolver._analysis_cache
+                cache[digest] = tuple(suggestions)
+                cache.move_to_end(digest)
+                while len(cache) > SelfEvolver.ANALYSIS_CACHE_SIZE:
+                    cache.popitem(last=False)
         return suggestions
 
     @staticmethod
     def get_ai_suggestions(code: str):
         """Run Mistral via Ollama for AI-powered suggestions."""
+        return SelfEvolver._run_mistral(code)[0]
+
+    @staticmethod
+    def _run_mistral(code: str):
+        """Return Mistral's suggestions and whether the Ollama call succeeded."""
         prompt = (
             "Analyze this Python code and suggest improvements. "
             "Focus on detecting unused variables, inefficient logic, and possible optimizations:\n\n" + code
@@ -37,9 +76,9 @@ class SelfEvolver:
                 text=True,
             )
             ai_response = result.stdout.strip()
-            return ai_response.splitlines()
+            return ai_response.splitlines(), result.returncode == 0
         except Exception as e:
-            return [f"Error running Mistral analysis: {e}"]
+            return [f"Error running Mistral analysis: {e}"], False
 
     @staticmethod
     def apply_improvements(file_path: str, suggestions: list):
@@ -2,7 +2,9 @@ import os
 
 def list_files(directory):
     """List all files in the given directory."""
-    return [f for f in os.listdir(directory) if os.path.isfile(os.path.join(directory, f))]
+    # scandir reuses the file type from the directory read instead of a stat per entry
+    with os.scandir(directory) as entries:
+        return [entry.name for entry in entries if entry.is_file()]
 
 if __name__ == "__main__":
     print(list_files("."))
@@ -1,8 +1,45 @@
+import os
+import tempfile
 import unittest
 
+try:
+    from fastapi.testclient import TestClient
+except ImportError:
+    raise unittest.SkipTest("fastapi is not installed")
+
+from app.main import app
+
+
 class TestAPI(unittest.TestCase):
-    def test_api_endpoint(self):
-        self.assertTrue(True)
+    @classmethod
+    def setUpClass(cls):
+        cls.client = TestClient(app)
+
+    def setUp(self):
+        # generate_code writes into ./generated_code, so run each test from
+        # a throwaway working directory.
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(tmp_dir.name)
+
+    def test_generate_code(self):
+        feature_request = {
+            "name": "calculate_sum",
+            "given": "two numbers",
+            "when": "added together",
+            "then": "return their sum"
+        }
+        response = self.client.post("/api/v1/generate_code", json=feature_request)
+        self.assertEqual(response.status_code, 200)
+
+        generated_file_path = response.json()["file_path"]
+        self.assertTrue(os.path.exists(generated_file_path))
+        with open(generated_file_path, "r") as file:
+            generated_code = file.read()
+        self.assertIn("def calculate_sum()", generated_code)
+        self.assertIn("return their sum", generated_code)
+
 
 if __name__ == "__main__":
     unittest.main()
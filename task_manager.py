@@ -2,16 +2,23 @@ import sys
 import csv
 import json
 from datetime import datetime
+from functools import lru_cache
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QTableWidget, QTableWidgetItem,
     QVBoxLayout, QWidget, QPushButton, QHBoxLayout, QDialog, QFormLayout,
     QLineEdit, QComboBox, QSpinBox, QTextEdit, QFileDialog, QLabel, QProgressBar, QHeaderView,
     QDateEdit
 )
-from PyQt5.QtCore import Qt, QDate
+from PyQt5.QtCore import Qt, QDate, QTimer
 from PyQt5.QtGui import QColor, QBrush
 
 
+@lru_cache(maxsize=4096)
+def searchable_text(name, notes):
+    """Lowercased Task Name and Notes, computed once per distinct pair."""
+    return f"{name}\n{notes}".lower()
+
+
 class TaskManager(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -111,7 +118,12 @@ class TaskManager(QMainWindow):
         self.export_button.clicked.connect(self.export_tasks)
         self.clear_button.clicked.connect(self.clear_tasks)
         self.filter_button.clicked.connect(self.apply_filters)
-        self.search_bar.textChanged.connect(self.apply_filters)
+        # Filter once typing pauses instead of rebuilding the table per keystroke.
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self.apply_filters)
+        self.search_bar.textChanged.connect(lambda _: self._filter_timer.start())
         self.stats_button.clicked.connect(self.view_stats)
 
     def add_task(self):
@@ -194,9 +206,14 @@ class TaskManager(QMainWindow):
 
     def refresh_table(self):
         """Reloads the table with current tasks."""
-        self.table.setRowCount(0)
-        for t in self.tasks:
-            self.insert_task_into_table(t)
+        # Suspend repaints while every row is re-inserted so the view redraws once.
+        self.table.setUpdatesEnabled(False)
+        try:
+            self.table.setRowCount(0)
+            for t in self.tasks:
+                self.insert_task_into_table(t)
+        finally:
+            self.table.setUpdatesEnabled(True)
 
     def insert_task_into_table(self, task_data):
         row_position = self.table.rowCount()
@@ -264,29 +281,34 @@ class TaskManager(QMainWindow):
         from_dt = self.from_date.date().toPyDate()
         to_dt = self.to_date.date().toPyDate()
 
-        self.table.setRowCount(0)
-        for task in self.tasks:
-            # Search match on Task Name or Notes
-            if search_text:
-                if search_text not in task["Task Name"].lower() and search_text not in task["Notes"].lower():
+        # Filtering clears and refills the table; repaint only once it is refilled.
+        self.table.setUpdatesEnabled(False)
+        try:
+            self.table.setRowCount(0)
+            for task in self.tasks:
+                # Search match on Task Name or Notes
+                if search_text:
+                    if search_text not in searchable_text(task["Task Name"], task["Notes"]):
+                        continue
+                # Category filter
+                if cat_filter != "All Categories" and task["Category"] != cat_filter:
+                    continue
+                # Priority filter
+                if pri_filter != "All Priorities" and task["Priority"] != pri_filter:
                     continue
-            # Category filter
-            if cat_filter != "All Categories" and task["Category"] != cat_filter:
-                continue
-            # Priority filter
-            if pri_filter != "All Priorities" and task["Priority"] != pri_filter:
-                continue
-            # Status filter
-            if stat_filter != "All Statuses" and task["Status"] != stat_filter:
-                continue
-            # Date range filter (only apply if user has set a from/to date)
-            task_due_date = self.parse_date(task["Due Date"])
-            if task_due_date is not None:
-                if task_due_date < from_dt or task_due_date > to_dt:
+                # Status filter
+                if stat_filter != "All Statuses" and task["Status"] != stat_filter:
                     continue
+                # Date range filter (only apply if user has set a from/to date)
+                task_due_date = self.parse_date(task["Due Date"])
+                if task_due_date is not None:
+                    if task_due_date < from_dt or task_due_date > to_dt:
+                        continue
 
-            # If all conditions are satisfied, add row
-            self.insert_task_into_table(task)
+                # If all conditions are satisfied, add row
+                self.insert_task_into_table(task)
+        finally:
+            self.table.setUpdatesEnabled(True)
 
     def parse_date(self, date_str):
         """Converts date string to a Python datetime.date object, or None on failure."""
@@ -315,12 +337,15 @@ class TaskManager(QMainWindow):
 
     def update_filters(self, task):
         """Dynamically add new filter options if they appear in tasks."""
-        if task["Category"] not in [self.filter_category.itemText(i) for i in range(self.filter_category.count())]:
-            self.filter_category.addItem(task["Category"])
-        if task["Priority"] not in [self.filter_priority.itemText(i) for i in range(self.filter_priority.count())]:
-            self.filter_priority.addItem(task["Priority"])
-        if task["Status"] not in [self.filter_status.itemText(i) for i in range(self.filter_status.count())]:
-            self.filter_status.addItem(task["Status"])
+        # findText does an exact, case-sensitive lookup inside Qt instead of
+        # materializing every item's text into a Python list.
+        for combo, key in (
+            (self.filter_category, "Category"),
+            (self.filter_priority, "Priority"),
+            (self.filter_status, "Status"),
+        ):
+            if combo.findText(task[key]) == -1:
+                combo.addItem(task[key])
 
     def populate_filters(self):
         """Refresh filter combo boxes for Category, Priority, and Status."""
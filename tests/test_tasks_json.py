@@ -1,9 +1,12 @@
 import json
-import os
+from pathlib import Path
+
+# Resolve relative to the repository root so the test does not depend on
+# the working directory pytest (or an xdist worker) was started from.
+TASKS_FILE = Path(__file__).resolve().parent.parent / 'tasks.json'
 
 
 def test_tasks_file_exists_and_not_empty():
-    assert os.path.exists('tasks.json'), "tasks.json should exist"
-    with open('tasks.json') as f:
-        data = json.load(f)
+    assert TASKS_FILE.exists(), "tasks.json should exist"
+    data = json.loads(TASKS_FILE.read_bytes())
     assert isinstance(data, list) and len(data) > 0, "tasks.json should contain tasks"
@@ -3,18 +3,30 @@ from __future__ import annotations
 
 from pathlib import Path
 from typing import Iterable
-import matplotlib.pyplot as plt
+import numpy as np
 
 from ..journal.trade_entry import TradeEntry
 
 
+def equity_values(entries: Iterable[TradeEntry]) -> np.ndarray:
+    """Return equity after each trade, starting from 1.0; open trades leave it unchanged."""
+    # Reading the prices off the entries is one Python pass; the returns and
+    # the curve are then computed with array operations. Open trades carry
+    # a NaN exit, which np.where turns into a 0.0 return.
+    prices = np.array(
+        [(e.entry, np.nan if e.exit is None else e.exit) for e in entries],
+        dtype=float,
+    ).reshape(-1, 2)
+    entry, exit_ = prices.T
+    returns = np.where(np.isnan(exit_), 0.0, (exit_ - entry) / entry)
+    return np.cumprod(1.0 + returns)
+
+
 def plot_equity_curve(entries: Iterable[TradeEntry], path: Path) -> None:
-    values = []
-    equity = 1.0
-    for e in entries:
-        if e.exit is not None:
-            equity *= (1 + (e.exit - e.entry) / e.entry)
-        values.append(equity)
+    # pyplot is slow to import and only needed here, so load it on first plot.
+    import matplotlib.pyplot as plt
+
+    values = equity_values(entries)
     plt.figure()
     plt.plot(values)
     plt.title("Equity Curve")
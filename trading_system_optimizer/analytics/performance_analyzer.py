@@ -8,9 +8,14 @@ from ..journal.trade_entry import TradeEntry
 
 
 def win_rate(entries: Iterable[TradeEntry]) -> float:
-    wins = [e for e in entries if e.exit and e.exit > e.entry]
-    total = len([e for e in entries if e.exit is not None])
-    return len(wins) / total if total else 0.0
+    # Single pass with running counts, so generators work and no lists are built.
+    wins = total = 0
+    for e in entries:
+        if e.exit is not None:
+            total += 1
+            if e.exit > e.entry:
+                wins += 1
+    return wins / total if total else 0.0
 
 
 def average_gain(entries: Iterable[TradeEntry]) -> float:
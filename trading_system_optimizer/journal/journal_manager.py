@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import List
+from typing import Iterable, List
 import yaml
 
 from .trade_entry import TradeEntry
@@ -12,17 +12,22 @@ from ..config import TRADE_LOG_PATH
 def load_entries(path: Path = TRADE_LOG_PATH) -> List[TradeEntry]:
     if not path.exists():
         return []
-    with path.open("r", encoding="utf-8") as f:
-        raw = yaml.safe_load(f) or []
+    raw = yaml.safe_load(path.read_bytes()) or []
     return [TradeEntry.from_dict(item) for item in raw]
 
 
 def save_entries(entries: List[TradeEntry], path: Path = TRADE_LOG_PATH) -> None:
-    with path.open("w", encoding="utf-8") as f:
-        yaml.safe_dump([e.to_dict() for e in entries], f, sort_keys=False)
+    path.write_bytes(
+        yaml.safe_dump([e.to_dict() for e in entries], sort_keys=False, encoding="utf-8")
+    )
 
 
 def append_entry(entry: TradeEntry, path: Path = TRADE_LOG_PATH) -> None:
+    append_entries([entry], path)
+
+
+def append_entries(new_entries: Iterable[TradeEntry], path: Path = TRADE_LOG_PATH) -> None:
+    """Append several entries with a single load and a single save."""
     entries = load_entries(path)
-    entries.append(entry)
+    entries.extend(new_entries)
     save_entries(entries, path)
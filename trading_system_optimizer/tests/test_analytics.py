@@ -1,11 +1,30 @@
+import pytest
+
 from trading_system_optimizer.journal.trade_entry import TradeEntry
-from trading_system_optimizer.analytics import performance_analyzer
+from trading_system_optimizer.analytics import equity_curve, performance_analyzer
+
+
+@pytest.mark.parametrize(
+    "exits, expected",
+    [
+        ([2, 0.5, 1.5], 2/3),
+        ([2, None], 1.0),
+        ([0.5, 0.9], 0.0),
+        ([None, None], 0.0),
+        ([], 0.0),
+    ],
+    ids=["mixed", "open-trades-ignored", "all-losses", "all-open", "empty"],
+)
+def test_win_rate(exits, expected):
+    entries = [TradeEntry(ticker=f"T{i}", entry=1, exit=x) for i, x in enumerate(exits)]
+    assert performance_analyzer.win_rate(entries) == expected
+    assert performance_analyzer.win_rate(iter(entries)) == expected
 
 
-def test_win_rate():
+def test_equity_values():
     entries = [
         TradeEntry(ticker="A", entry=1, exit=2),
-        TradeEntry(ticker="B", entry=1, exit=0.5),
-        TradeEntry(ticker="C", entry=1, exit=1.5),
+        TradeEntry(ticker="B", entry=1),
+        TradeEntry(ticker="C", entry=1, exit=0.5),
     ]
-    assert performance_analyzer.win_rate(entries) == 2/3
+    assert equity_curve.equity_values(entries).tolist() == [2.0, 2.0, 1.0]
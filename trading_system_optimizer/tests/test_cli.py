@@ -1,13 +1,9 @@
-import subprocess
-from pathlib import Path
+from trading_system_optimizer import cli
 
 
 def test_cli_logs_trade(tmp_path):
     log_file = tmp_path / "log.yaml"
-    cli_script = Path(__file__).resolve().parent.parent / "cli.py"
-    subprocess.check_call([
-        "python",
-        str(cli_script),
+    cli.main([
         "AAPL",
         "100",
         "--exit",
@@ -10,3 +10,17 @@ def test_append_and_load(tmp_path):
     assert len(entries) == 1
     assert entries[0].ticker == "TEST"
     assert entries[0].exit == 1.2
+
+
+def test_append_entries_bulk(tmp_path):
+    path = tmp_path / "log.yaml"
+    journal_manager.append_entry(TradeEntry(ticker="OLD", entry=1.0), path)
+    journal_manager.append_entries(
+        [
+            TradeEntry(ticker="AAA", entry=1.0, exit=1.1),
+            TradeEntry(ticker="BBB", entry=2.0, exit=1.9),
+        ],
+        path,
+    )
+    entries = journal_manager.load_entries(path)
+    assert [e.ticker for e in entries] == ["OLD", "AAA", "BBB"]